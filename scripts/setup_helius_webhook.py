@@ -14,74 +14,59 @@ Example:
 import asyncio
 import os
 import sys
+from collections.abc import Callable
 from pathlib import Path
 
-import httpx
 from dotenv import load_dotenv
 
+loop_factory: Callable[[], asyncio.AbstractEventLoop] | None
+try:
+    import uvloop
+
+    loop_factory = uvloop.new_event_loop
+except ImportError:  # Not available on Windows
+    loop_factory = None
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Make `src` importable when run directly, without installing the package
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.ops import HeliusAdmin, WebhookSpec  # noqa: E402
+
 # Load .env from project root
-load_dotenv(Path(__file__).parent.parent / ".env")
+load_dotenv(PROJECT_ROOT / ".env")
 
 HELIUS_API_KEY = os.getenv("BOT_HELIUS_API_KEY")
 
 # Pump.fun program ID - monitors migrations to Raydium/PumpSwap
 PUMP_FUN_PROGRAM = "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"
 
-HELIUS_API_BASE = "https://api.helius.xyz/v0"
 
+async def create_webhook(admin: HeliusAdmin, webhook_url: str) -> dict | None:
+    """Create a Helius webhook for Pump.fun migration events.
 
-async def create_webhook(webhook_url: str) -> dict:
-    """Create a Helius webhook for Pump.fun migration events."""
-    if not HELIUS_API_KEY:
-        raise ValueError("BOT_HELIUS_API_KEY not set in .env")
+    Returns None if an identical webhook is already registered.
+    """
+    spec = WebhookSpec(webhook_url=webhook_url, account_addresses=(PUMP_FUN_PROGRAM,))
+    created = await admin.sync_webhooks([spec])
+    return created[0] if created else None
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{HELIUS_API_BASE}/webhooks",
-            params={"api-key": HELIUS_API_KEY},
-            json={
-                "webhookURL": webhook_url,
-                "transactionTypes": ["ANY"],
-                "accountAddresses": [PUMP_FUN_PROGRAM],
-                "webhookType": "enhanced",
-            },
-        )
-        response.raise_for_status()
-        return response.json()
-
-
-async def list_webhooks() -> list:
-    """List all existing webhooks."""
-    if not HELIUS_API_KEY:
-        raise ValueError("BOT_HELIUS_API_KEY not set in .env")
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{HELIUS_API_BASE}/webhooks",
-            params={"api-key": HELIUS_API_KEY},
-        )
-        response.raise_for_status()
-        return response.json()
 
-
-async def delete_webhook(webhook_id: str) -> None:
-    """Delete a webhook by ID."""
+async def main() -> None:
     if not HELIUS_API_KEY:
         raise ValueError("BOT_HELIUS_API_KEY not set in .env")
 
-    async with httpx.AsyncClient() as client:
-        response = await client.delete(
-            f"{HELIUS_API_BASE}/webhooks/{webhook_id}",
-            params={"api-key": HELIUS_API_KEY},
-        )
-        response.raise_for_status()
+    # One client (and connection pool) for every API call in this run
+    async with HeliusAdmin(HELIUS_API_KEY) as admin:
+        await run(admin)
 
 
-async def main() -> None:
+async def run(admin: HeliusAdmin) -> None:
     if len(sys.argv) < 2:
         # List existing webhooks
         print("Existing webhooks:")
-        webhooks = await list_webhooks()
+        webhooks = await admin.list_webhooks()
         for wh in webhooks:
             print(f"  ID: {wh.get('webhookID')}")
             print(f"  URL: {wh.get('webhookURL')}")
@@ -97,7 +82,7 @@ async def main() -> None:
 
     if sys.argv[1] == "--delete" and len(sys.argv) >= 3:
         webhook_id = sys.argv[2]
-        await delete_webhook(webhook_id)
+        await admin.delete_webhook(webhook_id)
         print(f"Deleted webhook: {webhook_id}")
         return
 
@@ -105,7 +90,11 @@ async def main() -> None:
     print(f"Creating webhook for Pump.fun migrations → {webhook_url}")
     print(f"  Pump.fun Program: {PUMP_FUN_PROGRAM}")
 
-    result = await create_webhook(webhook_url)
+    result = await create_webhook(admin, webhook_url)
+    if result is None:
+        print("\nWebhook already registered, nothing to do.")
+        return
+
     print(f"\nWebhook created!")
     print(f"  ID: {result.get('webhookID')}")
     print(f"  URL: {result.get('webhookURL')}")
@@ -113,4 +102,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main(), loop_factory=loop_factory)
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Configuration settings for Solana Memecoin Signal Bot."""
 
+from dataclasses import dataclass
 from enum import Enum
 from functools import lru_cache
 from pathlib import Path
@@ -9,6 +10,9 @@ import yaml
 from pydantic import BaseModel, Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# libyaml C bindings are much faster; fall back to pure Python if unavailable
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class RunMode(str, Enum):
     DRY_RUN = "dry-run"
@@ -20,10 +24,17 @@ class WebhookConfig(BaseModel):
     host: str = "0.0.0.0"
     port: int = 8000
     secret: str | None = None
+    workers: int = 4  # Background processors; 0 = process inline before responding
+    queue_max_size: int = 10000
+    drain_timeout_seconds: float = 10.0  # Max wait on shutdown for queued payloads
+    dedup_max_size: int = 10000  # Recent signatures remembered for dedup (LRU)
+    # Header carrying a per-delivery ID; repeats are acked without reading the body
+    delivery_id_header: str | None = None
 
 
-class FilterThresholds(BaseModel):
-    """Filter thresholds for migration signals."""
+@dataclass(slots=True, frozen=True)
+class FilterThresholds:
+    """Filter thresholds for migration signals (validated by Pydantic on load)."""
 
     min_market_cap_usd: float = 10000  # MC > $10,000
     min_volume_1h_usd: float = 5000  # 1h Volume > $5,000
@@ -36,6 +47,13 @@ class DexscreenerConfig(BaseModel):
     base_url: str = "https://api.dexscreener.com"
     timeout_seconds: float = 10.0
     max_retries: int = 3
+    retry_backoff_seconds: float = 0.2  # Doubles per attempt, plus jitter
+    retry_max_backoff_seconds: float = 5.0
+    max_connections: int = 1000  # httpx connection pool size
+    max_keepalive_connections: int = 100
+    max_concurrent_requests: int = 10  # Bounds in-flight API calls (rate limits)
+    cache_ttl_seconds: float = 15.0  # Reuse lookups for the same token
+    cache_max_size: int = 4096
 
 
 class TelegramConfig(BaseModel):
@@ -71,19 +89,30 @@ class Settings(BaseSettings):
         yaml_config: dict[str, Any] = {}
         if path.exists():
             with open(path) as f:
-                yaml_config = yaml.safe_load(f) or {}
+                yaml_config = yaml.load(f, Loader=_YamlLoader) or {}
         return cls(**yaml_config)
 
 
-@lru_cache
 def get_settings(config_path: str | None = None) -> Settings:
     """Get cached settings instance."""
+    return _load_settings(_resolve_config_path(config_path))
+
+
+def _resolve_config_path(config_path: str | None) -> str | None:
+    """Resolve the config file to an absolute path, so equivalent args share a cache key."""
     if config_path:
-        return Settings.from_yaml(Path(config_path))
+        return str(Path(config_path).resolve())
 
     # Try default locations
     for default_path in [Path("config/config.yaml"), Path("config.yaml")]:
         if default_path.exists():
-            return Settings.from_yaml(default_path)
+            return str(default_path.resolve())
 
+    return None
+
+
+@lru_cache
+def _load_settings(config_path: str | None) -> Settings:
+    if config_path:
+        return Settings.from_yaml(Path(config_path))
     return Settings()
\ No newline at end of file
@@ -0,0 +1,41 @@
+import time
+from collections import OrderedDict
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class TTLCache(Generic[T]):
+    """In-memory LRU cache whose entries expire `ttl_seconds` after being set."""
+
+    def __init__(self, ttl_seconds: float, max_size: int = 4096):
+        self._ttl = ttl_seconds
+        self._max_size = max_size
+        self._store: OrderedDict[str, tuple[float, T]] = OrderedDict()
+
+    def get(self, key: str) -> T | None:
+        """Get a live value by key, or None if missing or expired."""
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._store[key]
+            return None
+        return value
+
+    def set(self, key: str, value: T) -> None:
+        """Store value under key, evicting least recently set if at capacity."""
+        self._store[key] = (time.monotonic() + self._ttl, value)
+        self._store.move_to_end(key)
+
+        while len(self._store) > self._max_size:
+            self._store.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clear all entries."""
+        self._store.clear()
+
+    def __len__(self) -> int:
+        return len(self._store)
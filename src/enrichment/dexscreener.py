@@ -1,22 +1,36 @@
 """Dexscreener API client for fetching token pair data."""
 
+import asyncio
+import random
+import sys
+import time
+from collections.abc import Callable
 from datetime import UTC, datetime
+from functools import cached_property
 from typing import Any
 
 import httpx
+import orjson
 from pydantic import BaseModel
 
 from src.config import Settings
+from src.enrichment.cache import TTLCache
 from src.utils import get_logger
 
 logger = get_logger(__name__)
 
+# Dexscreener accepts up to 30 comma-separated addresses per token lookup
+MAX_TOKENS_PER_REQUEST = 30
+
+# Dexes a migrated Pump.fun token can land on (dex ids are lowercased at parse)
+_TARGET_DEXES: frozenset[str] = frozenset({"raydium", "pumpswap"})
+
 
 class PairData(BaseModel):
     """Parsed pair data from Dexscreener."""
 
     pair_address: str
-    dex_id: str  # "raydium", "pumpswap", etc.
+    dex_id: str  # Lowercased: "raydium", "pumpswap", etc.
     base_token: str  # Token mint address
     quote_token: str  # Usually SOL
 
@@ -28,71 +42,225 @@ class PairData(BaseModel):
     liquidity_usd: float | None = None
 
     # Pair info
-    pair_created_at: datetime | None = None
+    pair_created_at_ms: int | None = None  # Unix epoch milliseconds
     age_minutes: float | None = None
 
     # Links
     url: str | None = None
 
+    @cached_property
+    def pair_created_at(self) -> datetime | None:
+        """Pair creation time (UTC), built on first access."""
+        if self.pair_created_at_ms is None:
+            return None
+        return datetime.fromtimestamp(self.pair_created_at_ms / 1000, tz=UTC)
+
     @property
     def chart_url(self) -> str:
         """Dexscreener chart URL."""
         return f"https://dexscreener.com/solana/{self.pair_address}"
 
 
+def _liquidity(pair: PairData) -> float:
+    """Sort key: pair liquidity in USD, missing treated as zero."""
+    return pair.liquidity_usd or 0
+
+
 class DexscreenerClient:
-    """Client for Dexscreener API."""
+    """Client for Dexscreener API.
 
-    def __init__(self, settings: Settings):
+    Holds one pooled `httpx.AsyncClient` for its whole lifetime so repeated
+    lookups reuse keep-alive connections. Call `aclose()` (or use as an async
+    context manager) when done.
+    """
+
+    def __init__(self, settings: Settings, transport: httpx.AsyncBaseTransport | None = None):
         self.settings = settings
         self.base_url = settings.dexscreener.base_url
         self.timeout = settings.dexscreener.timeout_seconds
         self.max_retries = settings.dexscreener.max_retries
+        self.retry_backoff = settings.dexscreener.retry_backoff_seconds
+        self.retry_max_backoff = settings.dexscreener.retry_max_backoff_seconds
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=settings.dexscreener.max_connections,
+                max_keepalive_connections=settings.dexscreener.max_keepalive_connections,
+                keepalive_expiry=30.0,
+            ),
+            transport=transport,
+        )
+        # Shared by every lookup so bursts stay within Dexscreener's rate limits
+        self._request_slots = asyncio.Semaphore(settings.dexscreener.max_concurrent_requests)
+        # Successful lookups (including empty ones) keyed by token address
+        self._cache: TTLCache[list[PairData]] = TTLCache(
+            ttl_seconds=settings.dexscreener.cache_ttl_seconds,
+            max_size=settings.dexscreener.cache_max_size,
+        )
+        # In-flight batch fetches by token, so concurrent lookups share a request
+        self._inflight: dict[str, asyncio.Task[dict[str, list[PairData]] | None]] = {}
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "DexscreenerClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
 
     async def get_pairs_by_token(self, token_address: str) -> list[PairData]:
         """Fetch all pairs for a token from Dexscreener.
 
-        Returns pairs sorted by liquidity (highest first).
+        Returns pairs sorted by liquidity (highest first). Results are cached
+        for `cache_ttl_seconds`; treat the returned list as read-only.
         """
-        url = f"{self.base_url}/latest/dex/tokens/{token_address}"
+        results = await self.get_pairs_by_tokens([token_address], sort=True)
+        return results[token_address]
+
+    async def get_pairs_by_tokens(
+        self,
+        token_addresses: list[str],
+        allowed_dexes: frozenset[str] | None = None,
+        sort: bool = False,
+    ) -> dict[str, list[PairData]]:
+        """Fetch pairs for many tokens, batching up to 30 addresses per request.
+
+        Returns a mapping of token address to its pairs, sorted by liquidity
+        (highest first) only if `sort` is set. If `allowed_dexes` is given
+        (lowercase dex ids), other pairs are dropped before parsing. Tokens
+        whose lookup failed map to an empty list.
+        """
+        # Filtered and unfiltered results are cached separately
+        key_suffix = "" if allowed_dexes is None else "|" + ",".join(sorted(allowed_dexes))
+
+        results: dict[str, list[PairData]] = {}
+        pending: dict[str, asyncio.Task[dict[str, list[PairData]] | None]] = {}
+        to_fetch: list[str] = []
+
+        for token in dict.fromkeys(token_addresses):
+            key = token + key_suffix
+            cached = self._cache.get(key)
+            if cached is not None:
+                results[token] = cached
+            elif (inflight := self._inflight.get(key)) is not None:
+                pending[token] = inflight
+            else:
+                to_fetch.append(token)
+
+        for i in range(0, len(to_fetch), MAX_TOKENS_PER_REQUEST):
+            chunk = to_fetch[i : i + MAX_TOKENS_PER_REQUEST]
+            keys = [token + key_suffix for token in chunk]
+            task = asyncio.ensure_future(self._fetch_pairs(chunk, allowed_dexes))
+            for token, key in zip(chunk, keys, strict=True):
+                self._inflight[key] = task
+                pending[token] = task
+            task.add_done_callback(self._make_inflight_cleanup(keys))
+
+        for token, task in pending.items():
+            fetched = await asyncio.shield(task)
+            if fetched is None:
+                results[token] = []
+                continue
+            pairs = fetched.get(token, [])
+            self._cache.set(token + key_suffix, pairs)
+            results[token] = pairs
+
+        if sort:
+            return {
+                token: sorted(pairs, key=_liquidity, reverse=True)
+                for token, pairs in results.items()
+            }
+        return results
+
+    def _make_inflight_cleanup(
+        self, keys: list[str]
+    ) -> Callable[[asyncio.Task[dict[str, list[PairData]] | None]], None]:
+        """Build a done-callback that forgets the finished in-flight fetch."""
+
+        def cleanup(task: asyncio.Task[dict[str, list[PairData]] | None]) -> None:
+            for key in keys:
+                if self._inflight.get(key) is task:
+                    del self._inflight[key]
+
+        return cleanup
+
+    async def _fetch_pairs(
+        self,
+        token_addresses: list[str],
+        allowed_dexes: frozenset[str] | None = None,
+    ) -> dict[str, list[PairData]] | None:
+        """Fetch pairs for up to 30 tokens in one request, with retries.
+
+        Returns pairs bucketed by requested token, or None if every attempt failed.
+        """
+        # Chain-scoped endpoint: returns a bare list of Solana pairs only
+        path = f"/tokens/v1/solana/{','.join(token_addresses)}"
 
         for attempt in range(self.max_retries):
+            retry_after: float | None = None
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.get(url)
-                    response.raise_for_status()
-                    data = response.json()
-
-                    pairs = self._parse_pairs(data, token_address)
-                    logger.info(
-                        "dexscreener_pairs_fetched",
-                        token=token_address,
-                        pairs_found=len(pairs),
-                    )
-                    return pairs
+                async with self._request_slots:
+                    response = await self._client.get(path)
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+
+                pairs = self._parse_pairs(data, allowed_dexes)
+                logger.info(
+                    "dexscreener_pairs_fetched",
+                    tokens=len(token_addresses),
+                    pairs_found=len(pairs),
+                )
+                return self._bucket_pairs(pairs, token_addresses)
 
             except httpx.TimeoutException:
                 logger.warning(
                     "dexscreener_timeout",
-                    token=token_address,
+                    tokens=token_addresses,
                     attempt=attempt + 1,
                 )
             except httpx.HTTPStatusError as e:
                 logger.warning(
                     "dexscreener_http_error",
-                    token=token_address,
+                    tokens=token_addresses,
                     status=e.response.status_code,
                     attempt=attempt + 1,
                 )
+                if e.response.status_code == 429:
+                    retry_after = self._parse_retry_after(e.response)
             except Exception as e:
                 logger.exception(
                     "dexscreener_error",
-                    token=token_address,
+                    tokens=token_addresses,
                     error=str(e),
                 )
                 break
 
-        return []
+            if attempt + 1 < self.max_retries:
+                await asyncio.sleep(self._backoff_delay(attempt, retry_after))
+
+        return None
+
+    def _backoff_delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Exponential backoff with jitter, honoring the server's Retry-After."""
+        if retry_after is not None:
+            return min(retry_after, self.retry_max_backoff)
+        delay = self.retry_backoff * 2.0**attempt + random.uniform(0, self.retry_backoff)
+        return min(delay, self.retry_max_backoff)
+
+    @staticmethod
+    def _parse_retry_after(response: httpx.Response) -> float | None:
+        """Parse a Retry-After header given in seconds."""
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            return None
 
     async def get_raydium_or_pumpswap_pair(self, token_address: str) -> PairData | None:
         """Get the best Raydium or PumpSwap pair for a token.
@@ -100,28 +268,37 @@ class DexscreenerClient:
         Returns the pair with highest liquidity on Raydium or PumpSwap,
         or None if no such pair exists.
         """
-        pairs = await self.get_pairs_by_token(token_address)
-
-        # Filter for Raydium or PumpSwap pairs on Solana
-        target_dexes = {"raydium", "pumpswap"}
-        matching_pairs = [
-            p for p in pairs
-            if p.dex_id.lower() in target_dexes
-        ]
+        pairs_by_token = await self.get_pairs_by_tokens(
+            [token_address], allowed_dexes=_TARGET_DEXES
+        )
+        return self._select_raydium_or_pumpswap_pair(token_address, pairs_by_token[token_address])
+
+    async def get_raydium_or_pumpswap_pairs(
+        self, token_addresses: list[str]
+    ) -> dict[str, PairData | None]:
+        """Batched `get_raydium_or_pumpswap_pair` for many tokens."""
+        pairs_by_token = await self.get_pairs_by_tokens(
+            token_addresses, allowed_dexes=_TARGET_DEXES
+        )
+        return {
+            token: self._select_raydium_or_pumpswap_pair(token, pairs)
+            for token, pairs in pairs_by_token.items()
+        }
 
-        if not matching_pairs:
+    @staticmethod
+    def _select_raydium_or_pumpswap_pair(
+        token_address: str, pairs: list[PairData]
+    ) -> PairData | None:
+        """Pick the highest liquidity pair from already dex-filtered pairs."""
+        if not pairs:
             logger.debug(
                 "no_raydium_pumpswap_pair",
                 token=token_address,
-                total_pairs=len(pairs),
             )
             return None
 
         # Return highest liquidity pair
-        best_pair = max(
-            matching_pairs,
-            key=lambda p: p.liquidity_usd or 0
-        )
+        best_pair = max(pairs, key=_liquidity)
 
         logger.info(
             "raydium_pumpswap_pair_found",
@@ -134,40 +311,62 @@ class DexscreenerClient:
 
         return best_pair
 
-    def _parse_pairs(self, data: dict[str, Any], token_address: str) -> list[PairData]:
-        """Parse Dexscreener API response into PairData objects."""
+    @staticmethod
+    def _bucket_pairs(
+        pairs: list[PairData], token_addresses: list[str]
+    ) -> dict[str, list[PairData]]:
+        """Group pairs by the requested token they trade (base or quote side)."""
+        buckets: dict[str, list[PairData]] = {token: [] for token in token_addresses}
+        for pair in pairs:
+            if pair.base_token in buckets:
+                buckets[pair.base_token].append(pair)
+            elif pair.quote_token in buckets:
+                buckets[pair.quote_token].append(pair)
+        return buckets
+
+    def _parse_pairs(
+        self, raw_pairs: list[dict[str, Any]] | None, allowed_dexes: frozenset[str] | None = None
+    ) -> list[PairData]:
+        """Parse Dexscreener pair list into PairData objects.
+
+        Pairs on other chains, or on dexes outside `allowed_dexes`, are skipped
+        before any other work.
+        """
         pairs: list[PairData] = []
 
-        raw_pairs = data.get("pairs") or []
-        now = datetime.now(UTC)
+        now_ms = time.time() * 1000
 
-        for raw in raw_pairs:
+        for raw in raw_pairs or ():
             try:
                 # Only Solana pairs
                 if raw.get("chainId") != "solana":
                     continue
+                # A handful of dex ids repeat across every pair; share one str each
+                dex_id = sys.intern((raw.get("dexId") or "").lower())
+                if allowed_dexes and dex_id not in allowed_dexes:
+                    continue
 
-                # Parse creation time and calculate age
-                pair_created_at = None
+                # Calculate age straight from the epoch-ms creation timestamp
+                created_ms = raw.get("pairCreatedAt") or None
                 age_minutes = None
-                if created_ts := raw.get("pairCreatedAt"):
-                    pair_created_at = datetime.fromtimestamp(created_ts / 1000, tz=UTC)
-                    age_minutes = (now - pair_created_at).total_seconds() / 60
+                if created_ms is not None:
+                    age_minutes = (now_ms - created_ms) / 60_000
 
                 # Extract volume data
                 volume_data = raw.get("volume") or {}
 
-                pair = PairData(
-                    pair_address=raw.get("pairAddress", ""),
-                    dex_id=raw.get("dexId", ""),
-                    base_token=raw.get("baseToken", {}).get("address", ""),
-                    quote_token=raw.get("quoteToken", {}).get("address", ""),
+                # Every field is coerced here, so skip Pydantic validation
+                pair = PairData.model_construct(
+                    pair_address=raw.get("pairAddress") or "",
+                    dex_id=dex_id,
+                    base_token=(raw.get("baseToken") or {}).get("address") or "",
+                    quote_token=(raw.get("quoteToken") or {}).get("address") or "",
                     price_usd=self._safe_float(raw.get("priceUsd")),
                     market_cap_usd=self._safe_float(raw.get("marketCap")),
                     volume_1h_usd=self._safe_float(volume_data.get("h1")),
                     volume_24h_usd=self._safe_float(volume_data.get("h24")),
-                    liquidity_usd=self._safe_float(raw.get("liquidity", {}).get("usd")),
-                    pair_created_at=pair_created_at,
+                    liquidity_usd=self._safe_float((raw.get("liquidity") or {}).get("usd")),
+                    pair_created_at_ms=created_ms,
                     age_minutes=age_minutes,
                     url=raw.get("url"),
                 )
@@ -180,8 +379,6 @@ class DexscreenerClient:
                     pair_address=raw.get("pairAddress"),
                 )
 
-        # Sort by liquidity (highest first)
-        pairs.sort(key=lambda p: p.liquidity_usd or 0, reverse=True)
         return pairs
 
     @staticmethod
@@ -1,3 +1,3 @@
-from src.filters.base import BaseFilter, FilterChain, FilterResult
+from src.filters.base import BaseFilter, FilterChain, FilterResult, SyncFilter
 
-__all__ = ["FilterResult", "BaseFilter", "FilterChain"]
\ No newline at end of file
+__all__ = ["FilterResult", "BaseFilter", "SyncFilter", "FilterChain"]
\ No newline at end of file
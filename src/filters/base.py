@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 T = TypeVar("T")
 
@@ -26,6 +26,10 @@ class FilterResult:
 class BaseFilter(ABC, Generic[T]):
     """Base class for all filters. Implement `evaluate` to add custom logic."""
 
+    # Run order within a chain (lowest first). Give cheap, selective filters
+    # a low priority so most rejections happen early.
+    priority: int = 0
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -38,20 +42,51 @@ class BaseFilter(ABC, Generic[T]):
         ...
 
 
+class SyncFilter(BaseFilter[T]):
+    """Base class for filters that need no I/O. Implement `evaluate_sync`.
+
+    FilterChain calls `evaluate_sync` directly, skipping the coroutine overhead.
+    """
+
+    @abstractmethod
+    def evaluate_sync(self, event: T) -> FilterResult:
+        """Evaluate the event against this filter."""
+        ...
+
+    async def evaluate(self, event: T) -> FilterResult:
+        return self.evaluate_sync(event)
+
+
 class FilterChain(Generic[T]):
-    """Chain of filters applied sequentially. Stops on first rejection."""
+    """Chain of filters applied sequentially. Stops on first rejection.
+
+    Sync filters run before async ones; each group runs in priority order
+    (insertion order for equal priorities).
+    """
 
     def __init__(self, filters: list[BaseFilter[T]] | None = None):
-        self._filters: list[BaseFilter[T]] = filters or []
+        self._sync_filters: list[SyncFilter[T]] = []
+        self._async_filters: list[BaseFilter[T]] = []
+        for f in filters or []:
+            self.add(f)
 
     def add(self, filter_: BaseFilter[T]) -> "FilterChain[T]":
         """Add a filter to the chain. Returns self for chaining."""
-        self._filters.append(filter_)
+        if isinstance(filter_, SyncFilter):
+            self._sync_filters.append(filter_)
+            self._sync_filters.sort(key=_priority)
+        else:
+            self._async_filters.append(filter_)
+            self._async_filters.sort(key=_priority)
         return self
 
     async def evaluate(self, event: T) -> FilterResult:
         """Run all filters. Returns first rejection or final accept."""
-        for f in self._filters:
+        for sf in self._sync_filters:
+            result = sf.evaluate_sync(event)
+            if not result.passed:
+                return FilterResult.reject(f"{sf.name}: {result.reason}")
+        for f in self._async_filters:
             result = await f.evaluate(event)
             if not result.passed:
                 return FilterResult.reject(f"{f.name}: {result.reason}")
@@ -59,4 +94,9 @@ class FilterChain(Generic[T]):
 
     @property
     def filters(self) -> list[BaseFilter[T]]:
-        return self._filters
\ No newline at end of file
+        """All filters in run order."""
+        return [*self._sync_filters, *self._async_filters]
+
+
+def _priority(filter_: BaseFilter[Any]) -> int:
+    return filter_.priority
\ No newline at end of file
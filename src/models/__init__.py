@@ -1,4 +1,4 @@
-"""Pydantic models for Pump.fun migration detection."""
+"""Event models for Pump.fun migration detection."""
 
 from src.models.events import HeliusWebhookPayload, MigrationEvent, SignalEvent
 
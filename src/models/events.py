@@ -1,5 +1,6 @@
 """Event models for Pump.fun migration detection."""
 
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
 
@@ -18,19 +19,38 @@ class HeliusWebhookPayload(BaseModel):
     webhook_id: str | None = Field(default=None, alias="webhookID")
     transactions: list[dict[str, Any]] = Field(default_factory=list)
 
+    @classmethod
+    def from_body(cls, body: Any) -> "HeliusWebhookPayload":
+        """Build the payload from a decoded JSON request body.
 
-class MigrationEvent(BaseModel):
-    """Event emitted when a Pump.fun token migrates to Raydium/PumpSwap."""
+        Helius posts a bare list of transactions. When every item is already a
+        dict the list is used as-is, skipping validation's per-transaction copy;
+        any other shape goes through normal validation.
+        """
+        if isinstance(body, list):
+            if all(isinstance(tx, dict) for tx in body):
+                return cls.model_construct(transactions=body)
+            body = {"transactions": body}
+        return cls.model_validate(body)
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class MigrationEvent:
+    """Event emitted when a Pump.fun token migrates to Raydium/PumpSwap.
+
+    Built internally by MigrationParser from already-parsed webhook data,
+    so it is a plain dataclass rather than a validating Pydantic model.
+    """
 
     tx_signature: str
-    timestamp: datetime = Field(default_factory=_utc_now)
+    timestamp: datetime = field(default_factory=_utc_now)
     slot: int | None = None
 
     # Token info
     token_mint: str  # The migrated token address
 
     # Raw data for debugging
-    raw_data: dict[str, Any] | None = Field(default=None, exclude=True)
+    raw_data: dict[str, Any] | None = field(default=None, repr=False, compare=False)
 
 
 class SignalEvent(BaseModel):
@@ -0,0 +1,5 @@
+"""Operational tooling (webhook administration)."""
+
+from src.ops.helius import HeliusAdmin, WebhookSpec
+
+__all__ = ["HeliusAdmin", "WebhookSpec"]
@@ -0,0 +1,101 @@
+"""Helius webhook admin API client."""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+HELIUS_API_BASE = "https://api.helius.xyz/v0"
+
+HTTP_LIMITS = httpx.Limits(
+    max_connections=1000,
+    max_keepalive_connections=100,
+    keepalive_expiry=30.0,
+)
+
+
+@dataclass(frozen=True)
+class WebhookSpec:
+    """Desired Helius webhook registration."""
+
+    webhook_url: str
+    account_addresses: tuple[str, ...]
+    transaction_types: tuple[str, ...] = ("ANY",)
+    webhook_type: str = "enhanced"
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "webhookURL": self.webhook_url,
+            "transactionTypes": list(self.transaction_types),
+            "accountAddresses": list(self.account_addresses),
+            "webhookType": self.webhook_type,
+        }
+
+    def matches(self, webhook: dict[str, Any]) -> bool:
+        """Check if an existing webhook (API response) already covers this spec."""
+        return (
+            webhook.get("webhookURL") == self.webhook_url
+            and webhook.get("webhookType") == self.webhook_type
+            and set(webhook.get("accountAddresses") or []) == set(self.account_addresses)
+        )
+
+
+class HeliusAdmin:
+    """Client for Helius webhook management.
+
+    Holds one pooled `httpx.AsyncClient`, so many operations share connections.
+    Use as an async context manager or call `aclose()` when done.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = HELIUS_API_BASE,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            params={"api-key": api_key},
+            http2=True,
+            limits=HTTP_LIMITS,
+            transport=transport,
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "HeliusAdmin":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def create_webhook(self, spec: WebhookSpec) -> dict[str, Any]:
+        """Create a webhook and return the API response."""
+        response = await self._client.post("/webhooks", json=spec.to_payload())
+        response.raise_for_status()
+        result: dict[str, Any] = response.json()
+        return result
+
+    async def list_webhooks(self) -> list[dict[str, Any]]:
+        """List all existing webhooks."""
+        response = await self._client.get("/webhooks")
+        response.raise_for_status()
+        result: list[dict[str, Any]] = response.json()
+        return result
+
+    async def delete_webhook(self, webhook_id: str) -> None:
+        """Delete a webhook by ID."""
+        response = await self._client.delete(f"/webhooks/{webhook_id}")
+        response.raise_for_status()
+
+    async def sync_webhooks(self, specs: list[WebhookSpec]) -> list[dict[str, Any]]:
+        """Create every spec not already registered, concurrently.
+
+        Returns the API responses for the webhooks that were created.
+        """
+        existing = await self.list_webhooks()
+        missing = [s for s in specs if not any(s.matches(wh) for wh in existing)]
+        return list(await asyncio.gather(*(self.create_webhook(s) for s in missing)))
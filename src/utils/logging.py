@@ -21,6 +21,8 @@ def setup_logging(log_level: str = "INFO", json_format: bool = True) -> None:
 
     structlog.configure(
         processors=[
+            # Drop disabled levels before any other processor does work
+            structlog.stdlib.filter_by_level,
             *shared_processors,
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
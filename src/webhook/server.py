@@ -1,23 +1,50 @@
 """FastAPI webhook server for Pump.fun migration detection."""
 
+import asyncio
+import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from dataclasses import asdict
 from typing import Any
 
+import orjson
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from src.config import Settings, get_settings
-from src.enrichment import DexscreenerClient
+from src.enrichment import DexscreenerClient, PairData
 from src.models.events import HeliusWebhookPayload, MigrationEvent, SignalEvent
 from src.utils import get_logger, setup_logging
 from src.webhook.idempotency import IdempotencyStore
 
 logger = get_logger(__name__)
+# stdlib logger behind `logger`, for cheap level checks on hot paths
+_level_logger = logging.getLogger(__name__)
 
 # Pump.fun program ID
 PUMP_FUN_PROGRAM = "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"
 
+# Helius `source` values that can carry a migration
+ALLOWED_SOURCES = frozenset({"PUMP_FUN"})
+
+# Known pool/DEX program IDs
+POOL_PROGRAMS = frozenset(
+    {
+        "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8",  # Raydium AMM
+        "CAMMCzo5YL8w4VFF8KVHrK22GGUsp5VTaW7grrKgrWqK",  # Raydium CLMM
+        "pSwpGyAJiLMTUidSTPXhNFyJz3aLH41mGqhW3s1hkLd",  # PumpSwap
+    }
+)
+
+# Common tokens that are never the migrating memecoin
+COMMON_TOKENS = frozenset(
+    {
+        "So11111111111111111111111111111111111111112",  # Wrapped SOL
+        "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",  # USDC
+        "Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB",  # USDT
+    }
+)
+
 
 class MigrationParser:
     """Parse Pump.fun migration events from Helius transactions."""
@@ -29,21 +56,16 @@ class MigrationParser:
         Pump.fun migrations have source=PUMP_FUN and involve token transfers
         to Raydium or PumpSwap pools.
         """
-        source = tx.get("source", "")
-        tx_type = tx.get("type", "")
-        signature = tx.get("signature", "")
-
-        # Must be from Pump.fun
-        if source != "PUMP_FUN":
+        # Must be from Pump.fun - checked first, most webhook traffic is not
+        if tx.get("source") not in ALLOWED_SOURCES:
             return None
 
-        # Look for token mint in the transaction
-        token_mint = MigrationParser._extract_token_mint(tx)
-        if not token_mint:
+        signature = tx.get("signature")
+        if not signature:
             return None
 
-        # Check if this looks like a migration (has LP-related activity)
-        if not MigrationParser._is_migration(tx):
+        token_mint, is_migration = MigrationParser._parse_core(tx)
+        if not token_mint or not is_migration:
             return None
 
         return MigrationEvent(
@@ -54,78 +76,56 @@ class MigrationParser:
         )
 
     @staticmethod
-    def _extract_token_mint(tx: dict[str, Any]) -> str | None:
-        """Extract the memecoin mint address from transaction."""
-        # Check token transfers
-        token_transfers = tx.get("tokenTransfers") or []
-        for transfer in token_transfers:
-            mint = transfer.get("mint", "")
-            # Skip common tokens (SOL wrapped, USDC, etc.)
-            if mint and not MigrationParser._is_common_token(mint):
-                return mint
-
-        # Check account data for token mints
-        account_data = tx.get("accountData") or []
-        for account in account_data:
-            if account.get("tokenBalanceChanges"):
-                for change in account["tokenBalanceChanges"]:
-                    mint = change.get("mint", "")
-                    if mint and not MigrationParser._is_common_token(mint):
-                        return mint
-
-        return None
+    def _parse_core(tx: dict[str, Any]) -> tuple[str | None, bool]:
+        """Extract the memecoin mint and check for migration signs in one pass.
 
-    @staticmethod
-    def _is_migration(tx: dict[str, Any]) -> bool:
-        """Check if transaction appears to be a migration.
-
-        Look for signs of liquidity pool creation:
-        - Multiple token transfers
-        - Interactions with Raydium/PumpSwap programs
-        - LP token minting
+        Each transaction sub-list is walked at most once. A migration shows
+        multiple token transfers or touches a Raydium/PumpSwap program.
         """
-        # Check for Raydium or pool-related instructions
-        instructions = tx.get("instructions") or []
-        account_keys = tx.get("accountKeys") or []
+        common_tokens = COMMON_TOKENS
+        token_transfers = tx.get("tokenTransfers") or []
 
-        # Known pool/DEX program IDs
-        pool_programs = {
-            "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8",  # Raydium AMM
-            "CAMMCzo5YL8w4VFF8KVHrK22GGUsp5VTaW7grrKgrWqK",  # Raydium CLMM
-            "pSwpGyAJiLMTUidSTPXhNFyJz3aLH41mGqhW3s1hkLd",  # PumpSwap
-        }
+        # Check token transfers, skipping common tokens (SOL wrapped, USDC, etc.)
+        mint: str | None = None
+        for transfer in token_transfers:
+            candidate = transfer.get("mint")
+            if candidate and candidate not in common_tokens:
+                mint = candidate
+                break
+        else:
+            # Check account data for token mints
+            for account in tx.get("accountData") or []:
+                for change in account.get("tokenBalanceChanges") or []:
+                    candidate = change.get("mint")
+                    if candidate and candidate not in common_tokens:
+                        mint = candidate
+                        break
+                if mint:
+                    break
+
+        if not mint:
+            return None, False
+
+        # Significant token movement is a migration sign on its own
+        if len(token_transfers) >= 2:
+            return mint, True
 
-        # Check if any pool programs are involved
-        for key in account_keys:
+        pool_programs = POOL_PROGRAMS
+
+        # Keys may be {"pubkey": ...} objects or bare strings; check each one's shape
+        for key in tx.get("accountKeys") or []:
             if isinstance(key, dict):
                 pubkey = key.get("pubkey", "")
             else:
                 pubkey = str(key)
             if pubkey in pool_programs:
-                return True
-
-        # Check instructions for pool programs
-        for inst in instructions:
-            program_id = inst.get("programId", "")
-            if program_id in pool_programs:
-                return True
+                return mint, True
 
-        # Also check for significant token movement (migration sign)
-        token_transfers = tx.get("tokenTransfers") or []
-        if len(token_transfers) >= 2:
-            return True
+        instructions = tx.get("instructions") or []
+        if any(inst.get("programId", "") in pool_programs for inst in instructions):
+            return mint, True
 
-        return False
-
-    @staticmethod
-    def _is_common_token(mint: str) -> bool:
-        """Check if mint is a common token (SOL, USDC, etc.)."""
-        common_tokens = {
-            "So11111111111111111111111111111111111111112",  # Wrapped SOL
-            "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",  # USDC
-            "Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB",  # USDT
-        }
-        return mint in common_tokens
+        return mint, False
 
 
 class WebhookHandler:
@@ -133,10 +133,21 @@ class WebhookHandler:
 
     def __init__(self, settings: Settings):
         self.settings = settings
-        self.seen_signatures: IdempotencyStore[bool] = IdempotencyStore(max_size=10000)
+        self.seen_signatures: IdempotencyStore[bool] = IdempotencyStore(
+            max_size=settings.webhook.dedup_max_size
+        )
         self.dexscreener = DexscreenerClient(settings)
         self.parser = MigrationParser()
 
+        # Snapshot thresholds once; config is immutable while running
+        self._min_market_cap = settings.filters.min_market_cap_usd
+        self._min_volume_1h = settings.filters.min_volume_1h_usd
+        self._max_age = settings.filters.max_age_minutes
+
+    async def aclose(self) -> None:
+        """Release long-lived resources (Dexscreener connection pool)."""
+        await self.dexscreener.aclose()
+
     async def handle(self, payload: HeliusWebhookPayload) -> dict[str, Any]:
         """Process webhook payload and return summary."""
         processed = 0
@@ -144,35 +155,57 @@ class WebhookHandler:
         migrations_detected = 0
         signals_generated = 0
 
+        migrations: list[MigrationEvent] = []
+
+        # Bind per-transaction calls once for the loop below
+        seen_contains = self.seen_signatures.contains
+        seen_add = self.seen_signatures.add
+        parse = self.parser.parse
+
+        # Level checks once per payload; skips building per-tx log calls
+        # that filter_by_level would drop anyway
+        log_debug = _level_logger.isEnabledFor(logging.DEBUG)
+        log_info = _level_logger.isEnabledFor(logging.INFO)
+
         for tx in payload.transactions:
             sig = tx.get("signature", "")
 
             # Idempotency check
-            if self.seen_signatures.contains(sig):
+            if seen_contains(sig):
                 duplicates += 1
-                logger.debug("duplicate_transaction", tx_sig=sig)
+                if log_debug:
+                    logger.debug("duplicate_transaction", tx_sig=sig)
                 continue
 
             # Mark as seen
-            self.seen_signatures.add(sig, True)
+            seen_add(sig, True)
             processed += 1
 
             # Try to parse as migration
-            migration = self.parser.parse(tx)
+            migration = parse(tx)
             if not migration:
                 continue
 
             migrations_detected += 1
-            logger.info(
-                "migration_detected",
-                tx_sig=sig,
-                token_mint=migration.token_mint,
+            if log_info:
+                logger.info(
+                    "migration_detected",
+                    tx_sig=sig,
+                    token_mint=migration.token_mint,
+                )
+            migrations.append(migration)
+
+        if migrations:
+            # One batched Dexscreener lookup for every migrated token in the payload
+            pairs = await self.dexscreener.get_raydium_or_pumpswap_pairs(
+                [m.token_mint for m in migrations]
             )
 
-            # Process migration and generate signal if filters pass
-            signal = await self._process_migration(migration)
-            if signal:
-                signals_generated += 1
+            # Apply filters and generate signals
+            for migration in migrations:
+                signal = self._process_migration(migration, pairs[migration.token_mint])
+                if signal:
+                    signals_generated += 1
 
         return {
             "status": "ok",
@@ -182,11 +215,10 @@ class WebhookHandler:
             "signals_generated": signals_generated,
         }
 
-    async def _process_migration(self, migration: MigrationEvent) -> SignalEvent | None:
-        """Process migration: fetch Dexscreener data, apply filters, log signal."""
-        # Fetch pair data from Dexscreener
-        pair = await self.dexscreener.get_raydium_or_pumpswap_pair(migration.token_mint)
-
+    def _process_migration(
+        self, migration: MigrationEvent, pair: PairData | None
+    ) -> SignalEvent | None:
+        """Process migration: apply filters to its Dexscreener pair, log signal."""
         if not pair:
             logger.info(
                 "no_dex_pair_found",
@@ -206,37 +238,35 @@ class WebhookHandler:
             return None
 
         # Apply filters
-        filters = self.settings.filters
-
-        if pair.market_cap_usd < filters.min_market_cap_usd:
+        if pair.market_cap_usd < self._min_market_cap:
             logger.debug(
                 "filter_rejected_mc",
                 token_mint=migration.token_mint,
                 mc=pair.market_cap_usd,
-                min_mc=filters.min_market_cap_usd,
+                min_mc=self._min_market_cap,
             )
             return None
 
-        if pair.volume_1h_usd < filters.min_volume_1h_usd:
+        if pair.volume_1h_usd < self._min_volume_1h:
             logger.debug(
                 "filter_rejected_volume",
                 token_mint=migration.token_mint,
                 vol_1h=pair.volume_1h_usd,
-                min_vol=filters.min_volume_1h_usd,
+                min_vol=self._min_volume_1h,
             )
             return None
 
-        if pair.age_minutes > filters.max_age_minutes:
+        if pair.age_minutes > self._max_age:
             logger.debug(
                 "filter_rejected_age",
                 token_mint=migration.token_mint,
                 age=pair.age_minutes,
-                max_age=filters.max_age_minutes,
+                max_age=self._max_age,
             )
             return None
 
-        # All filters passed - create signal
-        signal = SignalEvent(
+        # All filters passed - create signal (fields already typed, skip validation)
+        signal = SignalEvent.model_construct(
             token_mint=migration.token_mint,
             tx_signature=migration.tx_signature,
             dex=pair.dex_id,
@@ -260,17 +290,51 @@ class WebhookHandler:
             chart=signal.chart_url,
         )
 
-        # Print formatted message to console
-        print("\n" + "=" * 50)
-        print(signal.format_message())
-        print("=" * 50 + "\n")
-
         return signal
 
 
+async def _drain_queue(
+    queue: asyncio.Queue[HeliusWebhookPayload], handler: WebhookHandler
+) -> None:
+    """Process queued webhook payloads until cancelled."""
+    while True:
+        payload = await queue.get()
+        try:
+            result = await handler.handle(payload)
+            logger.info("webhook_processed", **result)
+        except Exception as e:
+            logger.exception("webhook_error", error=str(e))
+        finally:
+            queue.task_done()
+
+
+def _json_response(content: Any, status_code: int = status.HTTP_200_OK) -> Response:
+    """Serialize `content` with orjson into a plain JSON response."""
+    return Response(
+        content=orjson.dumps(content),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
 def create_app(settings: Settings | None = None) -> FastAPI:
-    """Create FastAPI application with dependency injection."""
+    """Create FastAPI application with dependency injection.
+
+    With `webhook.workers > 0`, `/webhook` validates the payload, queues it and
+    acks immediately; worker tasks started in the lifespan do the processing.
+    With `workers == 0` the payload is processed before responding.
+    """
     settings = settings or get_settings()
+    handler = WebhookHandler(settings)
+    queue: asyncio.Queue[HeliusWebhookPayload] = asyncio.Queue(
+        maxsize=settings.webhook.queue_max_size
+    )
+    workers: list[asyncio.Task[None]] = []
+    # Set on shutdown: new payloads are refused while the queue drains
+    draining = asyncio.Event()
+    debug_logging = settings.log_level.upper() == "DEBUG"
+    delivery_id_header = settings.webhook.delivery_id_header
+    seen_deliveries: IdempotencyStore[bool] = IdempotencyStore(max_size=1024)
 
     @asynccontextmanager
     async def lifespan(app: FastAPI) -> AsyncIterator[None]:
@@ -278,52 +342,95 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         logger.info(
             "server_starting",
             mode=settings.mode.value,
-            filters=settings.filters.model_dump(),
+            filters=asdict(settings.filters),
+        )
+        workers.extend(
+            asyncio.create_task(_drain_queue(queue, handler))
+            for _ in range(settings.webhook.workers)
         )
         yield
         logger.info("server_stopping")
 
+        # Payloads in the queue were already acked; finish them before stopping
+        draining.set()
+        if workers:
+            try:
+                await asyncio.wait_for(queue.join(), settings.webhook.drain_timeout_seconds)
+            except TimeoutError:
+                logger.warning("webhook_queue_drain_timeout", pending=queue.qsize())
+
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        workers.clear()
+        await handler.aclose()
+
     app = FastAPI(
         title="Solana Memecoin Signal Bot",
         version="0.1.0",
         lifespan=lifespan,
     )
-
-    handler = WebhookHandler(settings)
+    app.state.handler = handler
 
     @app.get("/health")
     async def health() -> dict[str, str]:
         return {"status": "healthy", "mode": settings.mode.value}
 
     @app.post("/webhook")
-    async def webhook(request: Request) -> JSONResponse:
+    async def webhook(request: Request) -> Response:
+        # Redelivered payloads are acked before the body is read or parsed
+        delivery_id = request.headers.get(delivery_id_header) if delivery_id_header else None
+        if delivery_id and seen_deliveries.contains(delivery_id):
+            logger.debug("duplicate_delivery", delivery_id=delivery_id)
+            return _json_response(
+                content={"status": "duplicate_delivery"}, status_code=status.HTTP_200_OK
+            )
+
         try:
-            raw_body = await request.json()
+            raw_body = orjson.loads(await request.body())
 
             # Log raw payload for analysis (debug mode)
-            if settings.log_level.upper() == "DEBUG":
+            if debug_logging:
                 logger.debug("raw_webhook_payload", payload=raw_body)
 
             # Helius sends a list of transactions directly
-            if isinstance(raw_body, list):
-                raw_body = {"transactions": raw_body}
+            payload = HeliusWebhookPayload.from_body(raw_body)
+            if settings.webhook.workers > 0:
+                if draining.is_set():
+                    # Shutting down: refuse so Helius redelivers instead of losing it
+                    return _json_response(
+                        content={"status": "shutting_down"},
+                        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    )
+                queue.put_nowait(payload)
+                if delivery_id:
+                    seen_deliveries.add(delivery_id, True)
+                return _json_response(content={"status": "queued"}, status_code=status.HTTP_200_OK)
 
-            payload = HeliusWebhookPayload.model_validate(raw_body)
             result = await handler.handle(payload)
-            return JSONResponse(content=result, status_code=status.HTTP_200_OK)
+            if delivery_id:
+                seen_deliveries.add(delivery_id, True)
+            return _json_response(content=result, status_code=status.HTTP_200_OK)
+        except asyncio.QueueFull:
+            # 503 makes Helius retry later instead of the payload being dropped
+            logger.warning("webhook_queue_full", queue_size=queue.qsize())
+            return _json_response(
+                content={"status": "busy"},
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
         except Exception as e:
             logger.exception("webhook_error", error=str(e))
-            return JSONResponse(
+            return _json_response(
                 content={"status": "error", "message": str(e)},
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
     @app.post("/webhook/debug")
-    async def webhook_debug(request: Request) -> JSONResponse:
+    async def webhook_debug(request: Request) -> Response:
         """Debug endpoint - logs full payload and returns it."""
-        raw_body = await request.json()
+        raw_body = orjson.loads(await request.body())
         logger.info("debug_webhook_payload", payload=raw_body)
-        return JSONResponse(content={"received": raw_body}, status_code=status.HTTP_200_OK)
+        return _json_response(content={"received": raw_body}, status_code=status.HTTP_200_OK)
 
     return app
 
@@ -0,0 +1,28 @@
+"""Shared test fixtures."""
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.config import Settings
+from src.config.settings import WebhookConfig
+from src.webhook.server import create_app
+
+
+@pytest.fixture(scope="session")
+def settings() -> Settings:
+    # Process inline so responses carry the handling summary
+    return Settings(webhook=WebhookConfig(workers=0))
+
+
+@pytest.fixture(scope="session")
+def app(settings: Settings) -> FastAPI:
+    return create_app(settings)
+
+
+@pytest.fixture(scope="session")
+def client(app: FastAPI) -> Iterator[TestClient]:
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,245 @@
+"""Tests for Dexscreener client."""
+
+import asyncio
+import time
+from collections.abc import Callable, Coroutine
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+
+from src.config import Settings
+from src.config.settings import DexscreenerConfig
+from src.enrichment import DexscreenerClient
+
+
+def make_pair(
+    token_address: str,
+    dex_id: str = "raydium",
+    liquidity_usd: float = 10000.0,
+    chain_id: str = "solana",
+) -> dict:
+    """Create a raw Dexscreener pair for testing."""
+    return {
+        "chainId": chain_id,
+        "dexId": dex_id,
+        "pairAddress": f"Pair{dex_id}{token_address}",
+        "baseToken": {"address": token_address},
+        "quoteToken": {"address": "So11111111111111111111111111111111111111112"},
+        "priceUsd": "0.0001",
+        "marketCap": 50000,
+        "volume": {"h1": 8000, "h24": 20000},
+        "liquidity": {"usd": liquidity_usd},
+        "url": f"https://dexscreener.com/solana/Pair{dex_id}{token_address}",
+    }
+
+
+Handler = (
+    Callable[[httpx.Request], httpx.Response]
+    | Callable[[httpx.Request], Coroutine[None, None, httpx.Response]]
+)
+
+
+def make_client(settings: Settings, handler: Handler) -> DexscreenerClient:
+    """Create a DexscreenerClient backed by a mock transport."""
+    return DexscreenerClient(settings, transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture
+def settings() -> Settings:
+    return Settings()
+
+
+class TestPairCache:
+    async def test_repeat_lookup_served_from_cache(self, settings: Settings) -> None:
+        calls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            return httpx.Response(200, json=[make_pair("TokenA")])
+
+        async with make_client(settings, handler) as client:
+            first = await client.get_pairs_by_token("TokenA")
+            second = await client.get_pairs_by_token("TokenA")
+
+        assert len(calls) == 1
+        assert first == second
+        assert first[0].base_token == "TokenA"
+
+    async def test_empty_result_is_cached(self, settings: Settings) -> None:
+        calls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            return httpx.Response(200, json=[])
+
+        async with make_client(settings, handler) as client:
+            assert await client.get_pairs_by_token("TokenA") == []
+            assert await client.get_pairs_by_token("TokenA") == []
+
+        assert len(calls) == 1
+
+    async def test_failed_lookup_not_cached(self, settings: Settings) -> None:
+        calls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            raise httpx.ConnectError("unreachable")
+
+        async with make_client(settings, handler) as client:
+            assert await client.get_pairs_by_token("TokenA") == []
+            assert await client.get_pairs_by_token("TokenA") == []
+
+        assert len(calls) == 2
+
+
+class TestBatchLookup:
+    async def test_tokens_batched_into_one_request(self, settings: Settings) -> None:
+        calls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            return httpx.Response(
+                200,
+                json=[make_pair("TokenA"), make_pair("TokenB", "pumpswap")],
+            )
+
+        async with make_client(settings, handler) as client:
+            result = await client.get_pairs_by_tokens(["TokenA", "TokenB", "TokenC"])
+
+        assert calls == ["/tokens/v1/solana/TokenA,TokenB,TokenC"]
+        assert [p.base_token for p in result["TokenA"]] == ["TokenA"]
+        assert [p.dex_id for p in result["TokenB"]] == ["pumpswap"]
+        assert result["TokenC"] == []
+
+    async def test_large_batch_split_into_chunks(self, settings: Settings) -> None:
+        calls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            return httpx.Response(200, json=[])
+
+        tokens = [f"Token{i}" for i in range(45)]
+        async with make_client(settings, handler) as client:
+            result = await client.get_pairs_by_tokens(tokens)
+
+        assert len(calls) == 2
+        assert set(result) == set(tokens)
+
+    async def test_cached_tokens_not_refetched(self, settings: Settings) -> None:
+        calls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            return httpx.Response(200, json=[])
+
+        async with make_client(settings, handler) as client:
+            await client.get_pairs_by_token("TokenA")
+            await client.get_pairs_by_tokens(["TokenA", "TokenB"])
+
+        assert calls == ["/tokens/v1/solana/TokenA", "/tokens/v1/solana/TokenB"]
+
+    async def test_single_token_lookup_sorted_by_liquidity(self, settings: Settings) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                json=[
+                    make_pair("TokenA", "orca", liquidity_usd=100.0),
+                    make_pair("TokenA", "raydium", liquidity_usd=3000.0),
+                    make_pair("TokenA", "pumpswap", liquidity_usd=900.0),
+                ],
+            )
+
+        async with make_client(settings, handler) as client:
+            pairs = await client.get_pairs_by_token("TokenA")
+
+        assert [p.liquidity_usd for p in pairs] == [3000.0, 900.0, 100.0]
+
+    async def test_concurrent_requests_bounded(self) -> None:
+        settings = Settings(dexscreener=DexscreenerConfig(max_concurrent_requests=1))
+        active = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            return httpx.Response(200, json=[])
+
+        tokens = [f"Token{i}" for i in range(90)]
+        async with make_client(settings, handler) as client:
+            await client.get_pairs_by_tokens(tokens)
+
+        assert peak == 1
+
+
+class TestRetries:
+    async def test_rate_limited_request_retried(self, settings: Settings) -> None:
+        responses = iter(
+            [
+                httpx.Response(429, headers={"Retry-After": "0"}),
+                httpx.Response(200, json=[make_pair("TokenA")]),
+            ]
+        )
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return next(responses)
+
+        async with make_client(settings, handler) as client:
+            pairs = await client.get_pairs_by_token("TokenA")
+
+        assert [p.base_token for p in pairs] == ["TokenA"]
+
+    async def test_backoff_grows_and_is_capped(self, settings: Settings) -> None:
+        base = settings.dexscreener.retry_backoff_seconds
+        cap = settings.dexscreener.retry_max_backoff_seconds
+
+        async with DexscreenerClient(settings) as client:
+            assert base <= client._backoff_delay(0) <= 2 * base
+            assert 2 * base <= client._backoff_delay(1) <= 3 * base
+            assert client._backoff_delay(20) == cap
+            assert client._backoff_delay(0, retry_after=1.5) == 1.5
+            assert client._backoff_delay(0, retry_after=600) == cap
+
+
+class TestRaydiumOrPumpswapPair:
+    async def test_other_dexes_and_chains_skipped(self, settings: Settings) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                json=[
+                    make_pair("TokenA", "orca", liquidity_usd=99999.0),
+                    make_pair("TokenA", "raydium", chain_id="ethereum"),
+                    make_pair("TokenA", "raydium", liquidity_usd=500.0),
+                    make_pair("TokenA", "PumpSwap", liquidity_usd=2000.0),
+                ],
+            )
+
+        async with make_client(settings, handler) as client:
+            pair = await client.get_raydium_or_pumpswap_pair("TokenA")
+
+        assert pair is not None
+        assert pair.dex_id == "pumpswap"
+        assert pair.liquidity_usd == 2000.0
+
+
+class TestParsePairs:
+    async def test_age_and_creation_time_from_epoch_ms(self, settings: Settings) -> None:
+        created_ms = int(time.time() * 1000) - 5 * 60_000
+        raw = {**make_pair("TokenA"), "pairCreatedAt": created_ms}
+
+        async with DexscreenerClient(settings) as client:
+            [pair] = client._parse_pairs([raw])
+
+        assert pair.age_minutes is not None
+        assert 5 <= pair.age_minutes < 6
+        assert pair.pair_created_at == datetime.fromtimestamp(created_ms / 1000, tz=UTC)
+
+    async def test_missing_creation_time(self, settings: Settings) -> None:
+        async with DexscreenerClient(settings) as client:
+            [pair] = client._parse_pairs([make_pair("TokenA")])
+
+        assert pair.age_minutes is None
+        assert pair.pair_created_at is None
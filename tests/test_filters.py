@@ -0,0 +1,68 @@
+"""Tests for filter chain."""
+
+from src.filters import BaseFilter, FilterChain, FilterResult, SyncFilter
+
+
+class MinValueFilter(SyncFilter[int]):
+    def __init__(self, minimum: int, priority: int = 0):
+        self.minimum = minimum
+        self.priority = priority
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return f"min_{self.minimum}"
+
+    def evaluate_sync(self, event: int) -> FilterResult:
+        self.calls += 1
+        if event < self.minimum:
+            return FilterResult.reject(f"{event} < {self.minimum}")
+        return FilterResult.accept()
+
+
+class EvenFilter(BaseFilter[int]):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return "even"
+
+    async def evaluate(self, event: int) -> FilterResult:
+        self.calls += 1
+        if event % 2:
+            return FilterResult.reject("odd")
+        return FilterResult.accept()
+
+
+class TestFilterChain:
+    async def test_accepts_when_all_pass(self) -> None:
+        chain = FilterChain[int]([EvenFilter(), MinValueFilter(10)])
+        result = await chain.evaluate(12)
+        assert result.passed
+
+    async def test_sync_filters_run_before_async(self) -> None:
+        even = EvenFilter()
+        minimum = MinValueFilter(10)
+        chain = FilterChain[int]([even, minimum])
+
+        result = await chain.evaluate(3)
+
+        assert not result.passed
+        assert result.reason == "min_10: 3 < 10"
+        assert even.calls == 0
+        assert chain.filters == [minimum, even]
+
+    async def test_priority_orders_filters(self) -> None:
+        loose = MinValueFilter(1, priority=10)
+        strict = MinValueFilter(100, priority=1)
+        chain = FilterChain[int]().add(loose).add(strict)
+
+        result = await chain.evaluate(50)
+
+        assert result.reason == "min_100: 50 < 100"
+        assert loose.calls == 0
+
+    async def test_sync_filter_usable_standalone(self) -> None:
+        result = await MinValueFilter(10).evaluate(5)
+        assert not result.passed
@@ -0,0 +1,104 @@
+"""Tests for Helius webhook admin client."""
+
+from collections.abc import Callable
+
+import httpx
+import orjson
+
+from src.ops import HeliusAdmin, WebhookSpec
+
+PUMP_FUN_PROGRAM = "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"
+
+
+def make_admin(handler: Callable[[httpx.Request], httpx.Response]) -> HeliusAdmin:
+    """Create a HeliusAdmin backed by a mock transport."""
+    return HeliusAdmin("test-key", transport=httpx.MockTransport(handler))
+
+
+def make_spec(url: str = "https://bot.example/webhook") -> WebhookSpec:
+    return WebhookSpec(webhook_url=url, account_addresses=(PUMP_FUN_PROGRAM,))
+
+
+def registered(spec: WebhookSpec, webhook_id: str = "wh1") -> dict:
+    """API representation of an existing webhook for `spec`."""
+    return {"webhookID": webhook_id, **spec.to_payload()}
+
+
+class TestWebhookSpec:
+    def test_matches_ignores_address_order(self) -> None:
+        spec = WebhookSpec(webhook_url="https://a", account_addresses=("X", "Y"))
+        webhook = {**spec.to_payload(), "accountAddresses": ["Y", "X"]}
+        assert spec.matches(webhook)
+
+    def test_different_url_does_not_match(self) -> None:
+        assert not make_spec("https://a").matches(registered(make_spec("https://b")))
+
+
+class TestHeliusAdmin:
+    async def test_create_webhook(self) -> None:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"webhookID": "wh1"})
+
+        spec = make_spec()
+        async with make_admin(handler) as admin:
+            result = await admin.create_webhook(spec)
+
+        [request] = requests
+        assert result == {"webhookID": "wh1"}
+        assert request.method == "POST"
+        assert request.url.path == "/v0/webhooks"
+        assert request.url.params["api-key"] == "test-key"
+        assert orjson.loads(request.content) == spec.to_payload()
+
+    async def test_list_webhooks(self) -> None:
+        existing = [registered(make_spec())]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert (request.method, request.url.path) == ("GET", "/v0/webhooks")
+            return httpx.Response(200, json=existing)
+
+        async with make_admin(handler) as admin:
+            assert await admin.list_webhooks() == existing
+
+    async def test_delete_webhook(self) -> None:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200)
+
+        async with make_admin(handler) as admin:
+            await admin.delete_webhook("wh1")
+
+        assert [(r.method, r.url.path) for r in requests] == [("DELETE", "/v0/webhooks/wh1")]
+
+    async def test_sync_creates_only_missing(self) -> None:
+        present = make_spec("https://bot.example/a")
+        missing = make_spec("https://bot.example/b")
+        created: list[dict] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "GET":
+                return httpx.Response(200, json=[registered(present)])
+            body = orjson.loads(request.content)
+            created.append(body)
+            return httpx.Response(200, json={"webhookID": "new", **body})
+
+        async with make_admin(handler) as admin:
+            result = await admin.sync_webhooks([present, missing])
+
+        assert created == [missing.to_payload()]
+        assert [r["webhookURL"] for r in result] == ["https://bot.example/b"]
+
+    async def test_sync_noop_when_registered(self) -> None:
+        spec = make_spec()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.method == "GET"
+            return httpx.Response(200, json=[registered(spec)])
+
+        async with make_admin(handler) as admin:
+            assert await admin.sync_webhooks([spec]) == []
@@ -0,0 +1,44 @@
+"""Tests for idempotency store."""
+
+from src.webhook.idempotency import IdempotencyStore
+
+
+class TestIdempotencyStore:
+    def test_add_and_contains(self) -> None:
+        store: IdempotencyStore[bool] = IdempotencyStore(max_size=10)
+        store.add("a", True)
+
+        assert store.contains("a")
+        assert not store.contains("b")
+        assert store.get("a") is True
+        assert len(store) == 1
+
+    def test_evicts_oldest_at_capacity(self) -> None:
+        store: IdempotencyStore[int] = IdempotencyStore(max_size=2)
+        store.add("a", 1)
+        store.add("b", 2)
+        store.add("c", 3)
+
+        assert not store.contains("a")
+        assert store.contains("b")
+        assert store.contains("c")
+        assert len(store) == 2
+
+    def test_contains_refreshes_recency(self) -> None:
+        store: IdempotencyStore[int] = IdempotencyStore(max_size=2)
+        store.add("a", 1)
+        store.add("b", 2)
+        assert store.contains("a")
+
+        store.add("c", 3)
+
+        assert store.contains("a")
+        assert not store.contains("b")
+
+    def test_re_add_keeps_original_value(self) -> None:
+        store: IdempotencyStore[int] = IdempotencyStore(max_size=2)
+        store.add("a", 1)
+        store.add("a", 2)
+
+        assert store.get("a") == 1
+        assert len(store) == 1
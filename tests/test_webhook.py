@@ -1,62 +1,96 @@
 """Tests for webhook server."""
 
+import asyncio
+from typing import Final
+
+import httpx
+import orjson
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from src.config import Settings
-from src.webhook.server import MigrationParser, create_app
+from src.config.settings import WebhookConfig
+from src.enrichment import PairData
+from src.models import MigrationEvent, SignalEvent
+from src.webhook.server import (
+    ALLOWED_SOURCES,
+    COMMON_TOKENS,
+    POOL_PROGRAMS,
+    MigrationParser,
+    WebhookHandler,
+    create_app,
+)
+
 
+@pytest.fixture(autouse=True)
+def reset_dedup(app: FastAPI) -> None:
+    """The app is shared across tests; start each one with no seen signatures."""
+    app.state.handler.seen_signatures.clear()
 
-@pytest.fixture
-def settings() -> Settings:
-    return Settings()
 
+DEFAULT_TOKEN_MINT = "TokenMint123456789abcdefghijklmnopqrstuvwx"
 
-@pytest.fixture
-def client(settings: Settings) -> TestClient:
-    app = create_app(settings)
-    return TestClient(app)
+# Shared by every make_pump_fun_tx call; nested values are never mutated
+_PUMP_FUN_TX_TEMPLATE: Final[dict] = {
+    "type": "SWAP",
+    "source": "PUMP_FUN",
+    "timestamp": 1706200000,
+    "slot": 123456,
+    "tokenTransfers": [
+        {
+            "mint": DEFAULT_TOKEN_MINT,
+            "tokenAmount": 1000000.0,
+            "fromUserAccount": "seller",
+            "toUserAccount": "buyer",
+        },
+        {
+            "mint": "So11111111111111111111111111111111111111112",
+            "tokenAmount": 100.0,
+            "fromUserAccount": "buyer",
+            "toUserAccount": "seller",
+        },
+    ],
+    "nativeTransfers": [],
+    "accountKeys": [
+        {"pubkey": "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8"},  # Raydium AMM
+    ],
+    "instructions": [],
+}
 
 
 def make_pump_fun_tx(
     signature: str,
-    token_mint: str = "TokenMint123456789abcdefghijklmnopqrstuvwx",
+    token_mint: str = DEFAULT_TOKEN_MINT,
     include_pool_program: bool = True,
 ) -> dict:
-    """Create a Pump.fun migration transaction for testing."""
-    tx: dict = {
-        "signature": signature,
-        "type": "SWAP",
-        "source": "PUMP_FUN",
-        "timestamp": 1706200000,
-        "slot": 123456,
-        "tokenTransfers": [
-            {
-                "mint": token_mint,
-                "tokenAmount": 1000000.0,
-                "fromUserAccount": "seller",
-                "toUserAccount": "buyer",
-            },
-            {
-                "mint": "So11111111111111111111111111111111111111112",
-                "tokenAmount": 100.0,
-                "fromUserAccount": "buyer",
-                "toUserAccount": "seller",
-            },
-        ],
-        "nativeTransfers": [],
-        "accountKeys": [],
-        "instructions": [],
-    }
-
-    if include_pool_program:
-        tx["accountKeys"] = [
-            {"pubkey": "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8"},  # Raydium AMM
-        ]
+    """Create a Pump.fun migration transaction for testing.
+
+    Shallow-copies the shared template; only the fields that vary are replaced.
+    """
+    tx = {**_PUMP_FUN_TX_TEMPLATE, "signature": signature}
+
+    if token_mint != DEFAULT_TOKEN_MINT:
+        token_transfer, sol_transfer = _PUMP_FUN_TX_TEMPLATE["tokenTransfers"]
+        tx["tokenTransfers"] = [{**token_transfer, "mint": token_mint}, sol_transfer]
+
+    if not include_pool_program:
+        tx["accountKeys"] = []
 
     return tx
 
 
+def post_webhook(
+    client: TestClient, payload: object, headers: dict[str, str] | None = None
+) -> httpx.Response:
+    """POST a payload to /webhook, serialized with orjson as the server decodes it."""
+    return client.post(
+        "/webhook",
+        content=orjson.dumps(payload),
+        headers={"content-type": "application/json", **(headers or {})},
+    )
+
+
 class TestHealthEndpoint:
     def test_health_returns_ok(self, client: TestClient) -> None:
         response = client.get("/health")
@@ -66,13 +100,13 @@ class TestHealthEndpoint:
 
 class TestWebhookEndpoint:
     def test_empty_payload(self, client: TestClient) -> None:
-        response = client.post("/webhook", json={"transactions": []})
+        response = post_webhook(client, {"transactions": []})
         assert response.status_code == 200
         assert response.json()["processed"] == 0
 
     def test_single_transaction(self, client: TestClient) -> None:
         payload = {"transactions": [make_pump_fun_tx("test_sig_123")]}
-        response = client.post("/webhook", json=payload)
+        response = post_webhook(client, payload)
         assert response.status_code == 200
         result = response.json()
         assert result["processed"] == 1
@@ -85,7 +119,7 @@ class TestWebhookEndpoint:
                 make_pump_fun_tx("dup_sig_001"),
             ]
         }
-        response = client.post("/webhook", json=payload)
+        response = post_webhook(client, payload)
         result = response.json()
         assert result["processed"] == 1
         assert result["duplicates"] == 1
@@ -102,7 +136,7 @@ class TestWebhookEndpoint:
                 }
             ]
         }
-        response = client.post("/webhook", json=payload)
+        response = post_webhook(client, payload)
         assert response.status_code == 200
         result = response.json()
         assert result["processed"] == 1
@@ -111,10 +145,112 @@ class TestWebhookEndpoint:
     def test_list_format_accepted(self, client: TestClient) -> None:
         """Helius sends raw list, not wrapped in dict."""
         payload = [make_pump_fun_tx("list_sig_001")]
-        response = client.post("/webhook", json=payload)
+        response = post_webhook(client, payload)
         assert response.status_code == 200
         assert response.json()["processed"] == 1
 
+    def test_non_string_signature_does_not_abort_payload(self, client: TestClient) -> None:
+        payload = [
+            {"signature": 123, "source": "RAYDIUM"},
+            {"signature": "ok_sig", "source": "RAYDIUM"},
+        ]
+        response = post_webhook(client, payload)
+        assert response.status_code == 200
+        assert response.json()["processed"] == 2
+
+    def test_list_with_non_object_rejected(self, client: TestClient) -> None:
+        response = post_webhook(client, ["not-a-transaction"])
+        assert response.status_code == 500
+        assert response.json()["status"] == "error"
+
+
+class TestDedupMemory:
+    def test_dedup_bounded_memory(self) -> None:
+        app = create_app(Settings(webhook=WebhookConfig(workers=0, dedup_max_size=1000)))
+        payload = {
+            "transactions": [{"signature": f"s{i}", "source": "RAYDIUM"} for i in range(10_000)]
+        }
+
+        with TestClient(app) as client:
+            response = post_webhook(client, payload)
+
+        assert response.json()["processed"] == 10_000
+        assert len(app.state.handler.seen_signatures) == 1000
+
+
+class TestConcurrentRequests:
+    async def test_concurrent_duplicates_processed_once(self, settings: Settings) -> None:
+        """Concurrent deliveries of one signature, driven straight through ASGI."""
+        app = create_app(settings)
+        body = orjson.dumps(
+            {"transactions": [{"signature": "concurrent_sig", "source": "RAYDIUM"}]}
+        )
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = await asyncio.gather(
+                *(client.post("/webhook", content=body) for _ in range(5))
+            )
+        await app.state.handler.aclose()
+
+        results = [r.json() for r in responses]
+        assert sum(r["processed"] for r in results) == 1
+        assert sum(r["duplicates"] for r in results) == 4
+
+
+class TestQueuedWebhook:
+    def test_payload_queued_and_acked(self) -> None:
+        app = create_app(Settings(webhook=WebhookConfig(workers=1)))
+        with TestClient(app) as client:
+            response = post_webhook(client, {"transactions": []})
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "queued"}
+
+    def test_queued_payload_processed_before_shutdown(self) -> None:
+        app = create_app(Settings(webhook=WebhookConfig(workers=1)))
+        payload = [{"signature": "queued_sig", "source": "RAYDIUM"}]
+
+        with TestClient(app) as client:
+            response = post_webhook(client, payload)
+            assert response.json() == {"status": "queued"}
+
+        # Lifespan shutdown drains the queue before cancelling workers
+        assert app.state.handler.seen_signatures.contains("queued_sig")
+
+    def test_full_queue_returns_503(self) -> None:
+        # No lifespan -> no workers draining the queue
+        app = create_app(Settings(webhook=WebhookConfig(workers=1, queue_max_size=1)))
+        client = TestClient(app)
+
+        assert post_webhook(client, {"transactions": []}).status_code == 200
+        response = post_webhook(client, {"transactions": []})
+        assert response.status_code == 503
+        assert response.json()["status"] == "busy"
+
+
+class TestDeliveryDedup:
+    def test_repeated_delivery_short_circuits(self) -> None:
+        settings = Settings(webhook=WebhookConfig(workers=0, delivery_id_header="X-Request-Id"))
+        client = TestClient(create_app(settings))
+        headers = {"X-Request-Id": "delivery-1"}
+
+        first = post_webhook(client, {"transactions": []}, headers=headers)
+        second = client.post("/webhook", content=b"not json", headers=headers)
+
+        assert first.json()["status"] == "ok"
+        assert second.status_code == 200
+        assert second.json() == {"status": "duplicate_delivery"}
+
+    def test_failed_delivery_not_recorded(self) -> None:
+        settings = Settings(webhook=WebhookConfig(workers=0, delivery_id_header="X-Request-Id"))
+        client = TestClient(create_app(settings))
+        headers = {"X-Request-Id": "delivery-2"}
+
+        assert client.post("/webhook", content=b"not json", headers=headers).status_code == 500
+        retry = post_webhook(client, {"transactions": []}, headers=headers)
+        assert retry.json()["status"] == "ok"
+
 
 class TestMigrationParser:
     def test_parse_valid_migration(self) -> None:
@@ -144,6 +280,11 @@ class TestMigrationParser:
         result = MigrationParser.parse(tx)
         assert result is None
 
+    def test_parse_without_signature_returns_none(self) -> None:
+        tx = make_pump_fun_tx("sig123")
+        del tx["signature"]
+        assert MigrationParser.parse(tx) is None
+
     def test_skips_common_tokens(self) -> None:
         """Should skip wrapped SOL and return the memecoin mint."""
         tx = make_pump_fun_tx("sig123", "MyMemecoin")
@@ -152,4 +293,61 @@ class TestMigrationParser:
         assert result is not None
         assert result.token_mint == "MyMemecoin"
         # Should not return wrapped SOL
-        assert result.token_mint != "So11111111111111111111111111111111111111112"
\ No newline at end of file
+        assert result.token_mint != "So11111111111111111111111111111111111111112"
+
+    def test_mixed_shape_account_keys(self) -> None:
+        raydium = "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8"
+        tx = make_pump_fun_tx("sig123", "MyTokenMint")
+        tx["tokenTransfers"] = tx["tokenTransfers"][:1]  # No transfer-count signal
+
+        tx["accountKeys"] = [{"pubkey": "other"}, raydium]
+        assert MigrationParser.parse(tx) is not None
+
+        tx["accountKeys"] = ["other", {"pubkey": raydium}]
+        assert MigrationParser.parse(tx) is not None
+
+    def test_filter_sets_are_frozensets(self) -> None:
+        """Parser filters are prebuilt hash sets, not per-call lists or sets."""
+        assert isinstance(ALLOWED_SOURCES, frozenset)
+        assert isinstance(COMMON_TOKENS, frozenset)
+        assert isinstance(POOL_PROGRAMS, frozenset)
+        assert "PUMP_FUN" in ALLOWED_SOURCES
+        assert "So11111111111111111111111111111111111111112" in COMMON_TOKENS
+
+
+class TestSignalGeneration:
+    def make_pair(self, **overrides: object) -> PairData:
+        fields: dict = {
+            "pair_address": "PairAddr123",
+            "dex_id": "raydium",
+            "base_token": "MyTokenMint",
+            "quote_token": "So11111111111111111111111111111111111111112",
+            "price_usd": 0.0001,
+            "market_cap_usd": 50000.0,
+            "volume_1h_usd": 8000.0,
+            "liquidity_usd": 12000.0,
+            "age_minutes": 5.0,
+        }
+        fields.update(overrides)
+        return PairData(**fields)
+
+    def test_signal_matches_validated_model(self, app: FastAPI) -> None:
+        handler: WebhookHandler = app.state.handler
+        migration = MigrationEvent(tx_signature="sig123", token_mint="MyTokenMint")
+
+        signal = handler._process_migration(migration, self.make_pair())
+
+        assert signal is not None
+        validated = SignalEvent.model_validate(signal.model_dump())
+        assert validated.model_dump() == signal.model_dump()
+        assert signal.token_mint == "MyTokenMint"
+        assert signal.dex == "raydium"
+        assert signal.chart_url == "https://dexscreener.com/solana/PairAddr123"
+
+    def test_filters_reject_low_market_cap(self, app: FastAPI) -> None:
+        handler: WebhookHandler = app.state.handler
+        migration = MigrationEvent(tx_signature="sig123", token_mint="MyTokenMint")
+
+        signal = handler._process_migration(migration, self.make_pair(market_cap_usd=10.0))
+
+        assert signal is None